@@ -1,10 +1,33 @@
+from functools import partial
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
 from qcodes.instrument import InstrumentModule
 from qcodes.instrument.visa import VisaInstrument, VisaInstrumentKWArgs
 from qcodes import Parameter
-from qcodes.utils.validators import Numbers, Bool
-from qcodes.validators import Enum
+from qcodes.validators import Bool, Enum, Numbers
+
+from ..parameters import CachedParameter
+from ..visa import VisaTransferMixin
+
+
+def _parse_on_off(value: str) -> str:
+    """Normalize a boolean reply ('1'/'0' or 'ON'/'OFF') to val_mapping keys."""
+    return 'ON' if value.strip() in ('1', 'ON') else 'OFF'
+
+
+def _parse_window(value: str) -> float | None:
+    value = value.strip()
+    return None if value == 'NONE' else float(value)
+
+
+def _format_window(value: float | None) -> str:
+    return 'NONE' if value is None else str(value)
+
+
+def _parse_first(values: NDArray[np.float64]) -> float:
+    return float(values[0])
 
 
 class FilterModule(InstrumentModule):
@@ -16,28 +39,31 @@ class FilterModule(InstrumentModule):
         # Digital filter enable/disable
         self.state = self.add_parameter(
             'state',
+            parameter_class=CachedParameter,
             label='Digital Filter Enable',
             get_cmd='SENS:VOLT:DFIL:STATe?',
             set_cmd='SENS:VOLT:DFIL:STATe {}',
             vals=Bool(),
             val_mapping={True: 'ON', False: 'OFF'},
-            get_parser=lambda v: v.strip().upper() == 'ON',
+            get_parser=_parse_on_off,
             docstring='Enable or disable the digital filter.'
         )
         # Digital filter type
         self.type = self.add_parameter(
             'type',
+            parameter_class=CachedParameter,
             label='Digital Filter Type',
             get_cmd='SENS:VOLT:DFIL:TCON?',
             set_cmd='SENS:VOLT:DFIL:TCON {}',
             vals=Enum('MOVing', 'REPeat'),
             val_mapping={'moving': 'MOVing', 'repeat': 'REPeat'},
-            get_parser=lambda v: v.strip(),
+            get_parser=str.strip,
             docstring='Select digital filter type: MOVing or REPeat.'
         )
         # Digital filter sample count
         self.count = self.add_parameter(
             'count',
+            parameter_class=CachedParameter,
             label='Digital Filter Sample Count',
             get_cmd='SENS:VOLT:DFIL:COUNT?',
             set_cmd='SENS:VOLT:DFIL:COUNT {}',
@@ -48,33 +74,38 @@ class FilterModule(InstrumentModule):
         # Digital filter window percent
         self.window = self.add_parameter(
             'window',
+            parameter_class=CachedParameter,
             label='Digital Filter Window',
             unit='%',
             get_cmd='SENS:VOLT:DFIL:WINDOW?',
             set_cmd='SENS:VOLT:DFIL:WINDOW {}',
-            set_parser=lambda v: 'NONE' if v is None else str(v),
-            get_parser=lambda v: None if v.strip().upper() == 'NONE' else float(v),
+            set_parser=_format_window,
+            get_parser=_parse_window,
             docstring=('Digital filter window as percent of range ' 
                        '(0.01–10%), or None to disable (NONE).')
         )
         # Analog low-pass filter
         self.analog = self.add_parameter(
             'analog',
+            parameter_class=CachedParameter,
             label='Analog Low-pass Filter',
             get_cmd='SENS:VOLT:LPAS?',
             set_cmd='SENS:VOLT:LPAS {}',
             vals=Bool(),
             val_mapping={True: 'ON', False: 'OFF'},
-            get_parser=lambda v: v.strip().upper() == 'ON',
+            get_parser=_parse_on_off,
             docstring='Enable or disable the analog low-pass filter.'
         )
 
-        # Default settings
+    def configure_defaults(self) -> None:
+        """
+        Apply the default filter settings.
+        """
         self.state(True)
         self.count(1)
 
 
-class Keithley2182A(VisaInstrument):
+class Keithley2182A(VisaTransferMixin, VisaInstrument):
     """
     QCoDeS driver for Keithley 2182A nanovoltmeter.
 
@@ -84,29 +115,29 @@ class Keithley2182A(VisaInstrument):
       - Integration time (NPLC)
       - Filtering subsystem
     """
+    # single precision would truncate 7.5-digit readings
+    _binary_format = 'REAL,64'
+    _binary_datatype = 'd'
 
     def __init__(
         self,
         name: str,
         address: str,
         terminator: str = '\n',
+        skip_reset: bool = False,
         **kwargs: VisaInstrumentKWArgs
     ):
+        # chunk_size, binary_data, resource_manager and tcp_nodelay are
+        # handled by VisaTransferMixin
         super().__init__(name, address, terminator=terminator, **kwargs)
-        # Reset and basic configuration
-        self.write('*CLS')
-        self.write('CONF:VOLT')
-        self.write('SENS:CHAN 1')
-        # self.write('SENS:VOLT:DFIL:TCON REP')
-        # self.write('SENS:VOLT:DFIL ON')
 
         # Voltage reading
         self.add_parameter(
             'read',
             label='Voltage',
             unit='V',
-            get_cmd='READ?',
-            get_parser=float,
+            get_cmd=partial(self.ask_values, 'READ?', 1),
+            get_parser=_parse_first,
             docstring='Perform a single voltage measurement.'
         )
 
@@ -114,8 +145,8 @@ class Keithley2182A(VisaInstrument):
             'fetch',
             label='Voltage',
             unit='V',
-            get_cmd='FETC?',
-            get_parser=float,
+            get_cmd=partial(self.ask_values, 'FETC?', 1),
+            get_parser=_parse_first,
             docstring='Fetch a single voltage measurement result.'
         )
 
@@ -125,7 +156,7 @@ class Keithley2182A(VisaInstrument):
             label='Range',
             unit='V',
             get_cmd='SENS:VOLT:RANG?',
-            set_cmd='SENS:VOLT:RANG {:f}',
+            set_cmd=self._set_range,
             vals=Numbers(min_value=0, max_value=1e6),
             get_parser=float,
             docstring='Set or query the measurement range.'
@@ -134,18 +165,20 @@ class Keithley2182A(VisaInstrument):
         # Autorange on/off
         self.add_parameter(
             'autorange',
+            parameter_class=CachedParameter,
             label='Autorange',
             get_cmd='SENS:VOLT:RANG:AUTO?',
             set_cmd='SENS:VOLT:RANG:AUTO {:s}',
             vals=Bool(),
             val_mapping={True: 'ON', False: 'OFF'},
-            get_parser=lambda v: v.strip().upper() == 'ON',
+            get_parser=_parse_on_off,
             docstring='Enable or disable autoranging.'
         )
 
         # Integration time in power line cycles
         self.add_parameter(
             'nplc',
+            parameter_class=CachedParameter,
             label='Integration Time (NPLC)',
             get_cmd='SENS:VOLT:NPLC?',
             set_cmd='SENS:VOLT:NPLC {:f}',
@@ -159,7 +192,32 @@ class Keithley2182A(VisaInstrument):
         self.filter: FilterModule
         self.add_submodule('filter', FilterModule(self, 'filter'))
 
+        # Reconnecting to an already configured instrument can skip this
+        if not skip_reset:
+            self.configure_defaults()
+
         self.connect_message()
 
+    def configure_defaults(self) -> None:
+        """
+        Clear the status, configure DC voltage measurement on channel 1 and
+        apply the default filter settings.
+        """
+        self.write('*CLS')
+        self.write('CONF:VOLT')
+        # CONF:VOLT resets range, NPLC and filter settings behind the caches
+        for param in (*self.parameters.values(), *self.filter.parameters.values()):
+            if isinstance(param, CachedParameter):
+                param.cache.invalidate()
+        self.write('SENS:CHAN 1')
+        # self.write('SENS:VOLT:DFIL:TCON REP')
+        # self.write('SENS:VOLT:DFIL ON')
+        self.filter.configure_defaults()
+
+    def _set_range(self, value: float) -> None:
+        self.write(f'SENS:VOLT:RANG {value:f}')
+        # selecting a fixed range turns autoranging off
+        self.autorange.cache.set(False)
+
     def init(self):
         self.write('INIT')
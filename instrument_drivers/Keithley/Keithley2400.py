@@ -1,10 +1,14 @@
 from typing import Unpack
 
-from qcodes import Parameter
+import numpy as np
+from numpy.typing import NDArray
 from qcodes.instrument import VisaInstrumentKWArgs, InstrumentModule
 from qcodes.instrument_drivers.Keithley.Keithley_2400 import Keithley2400 as Keithley2400Base
 from qcodes.validators import Enum
 
+from ..parameters import CachedParameter
+from ..visa import VisaTransferMixin
+
 
 class Beeper(InstrumentModule):
     def __init__(self, parent: 'Keithley2400', name: str):
@@ -27,9 +31,22 @@ class Beeper(InstrumentModule):
         self.beep(800, 1)
 
 
-class Keithley2400(Keithley2400Base):
-    def __init__(self, name: str, address: str, **kwargs: "Unpack[VisaInstrumentKWArgs]"):
+class Keithley2400(VisaTransferMixin, Keithley2400Base):
+    # the 2400 only sends single precision binary readings
+    _binary_format = 'REAL,32'
+    _binary_datatype = 'f'
+
+    def __init__(
+        self,
+        name: str,
+        address: str,
+        **kwargs: "Unpack[VisaInstrumentKWArgs]"
+    ):
+        # chunk_size, binary_data, resource_manager and tcp_nodelay are
+        # handled by VisaTransferMixin
         super().__init__(name, address, **kwargs)
+        # digest of the voltage list last loaded into the source list
+        self.source_list_key: bytes | None = None
 
         # Add the beeper submodule for audible feedback
         self.add_submodule('beeper', Beeper(self, 'beeper'))
@@ -39,7 +56,7 @@ class Keithley2400(Keithley2400Base):
         self.terminals = self.add_parameter(
             'terminals',
             label='Input/Output Terminals',
-            parameter_class=Parameter,
+            parameter_class=CachedParameter,
             docstring='Select front or rear panel input/output jacks.',
             get_cmd=':ROUTe:TERMinals?',
             set_cmd=':ROUTe:TERMinals {}',
@@ -49,3 +66,33 @@ class Keithley2400(Keithley2400Base):
                 'rear': 'REAR'
             }
         )
+
+    def reset(self) -> None:
+        super().reset()
+        # settings are back to defaults, drop values cached by the driver
+        for param in self.parameters.values():
+            if isinstance(param, CachedParameter):
+                param.cache.invalidate()
+        self.source_list_key = None
+        # *RST also restores ASCII data and all five reading elements
+        self._configure_data_format()
+        self.write(':FORM:ELEM VOLT,CURR')
+
+    # The base driver parses ASCII ':READ?' replies; read through ask_values
+    def _get_read_output_protected(self) -> NDArray[np.float64]:
+        output = self.output.get_latest()
+        if output is None:
+            output = self.output.get()
+        if output != 1:
+            raise RuntimeError("Cannot perform read with output off")
+        # :FORM:ELEM VOLT,CURR, one (voltage, current) pair
+        return self.ask_values(':READ?', 2)
+
+    def _volt_parser(self, values: NDArray[np.float64]) -> float:
+        return float(values[0])
+
+    def _curr_parser(self, values: NDArray[np.float64]) -> float:
+        return float(values[1])
+
+    def _resistance_parser(self, values: NDArray[np.float64]) -> float:
+        return float(values[0] / values[1])
@@ -0,0 +1,24 @@
+from typing import Any
+
+from qcodes import Parameter
+
+
+class CachedParameter(Parameter):
+    """
+    Parameter for an instrument setting that only changes through the driver.
+
+    Once the value is known from a get or a set, further gets (including
+    snapshots) return the cached value instead of querying the instrument.
+    Call ``cache.invalidate()`` after the setting was changed by other means,
+    e.g. from the front panel, to read it back on the next get.
+    """
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        super().__init__(name, **kwargs)
+        query = self.get
+
+        def get() -> Any:
+            if self.cache.valid:
+                return self.cache.get(get_if_invalid=False)
+            return query()
+
+        self.get = get
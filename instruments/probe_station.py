@@ -1,12 +1,59 @@
-import time
-from typing import Optional, Literal
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional, Literal
 
 import numpy as np
+import pyvisa
 from numpy.typing import NDArray
 
 from ..instrument_drivers.Keithley.Keithley2182A import Keithley2182A
 from ..instrument_drivers.Keithley.Keithley2400 import Keithley2400
 
+# Keithley 2400 maximum source voltage (210 V range)
+_SOURCE_VOLTAGE_LIMIT = 210
+# Keithley 2400 accepts at most 100 points per source list command
+# and stores up to 2500 readings in its buffer.
+_SOURCE_LIST_CHUNK = 100
+_SOURCE_BUFFER_SIZE = 2500
+# Keithley 2182A buffer size and top voltage range
+_VOLTMETER_BUFFER_SIZE = 1024
+_VOLTMETER_MAX_RANGE = 100
+# 2182A Trigger Link lines: external trigger input and voltmeter complete
+# output, seen from the source-meter as its output and input line
+_TRIGGER_LINE_OUT = 1
+_TRIGGER_LINE_IN = 2
+# Voltmeter trigger delay (s) letting the source output settle before
+# the voltmeter integrates
+_SETTLE_DELAY = 0.01
+# Used to estimate how long an on-instrument sweep takes
+_LINE_FREQUENCY = 50
+
+
+def _validate_voltages(voltages: NDArray[float]) -> NDArray[np.float64]:
+    """
+    Check the whole sweep against the source-meter limits at once, since
+    setpoints are written as raw SCPI and skip parameter validation.
+    """
+    voltages = np.asarray(voltages, dtype=np.float64)
+    if voltages.ndim != 1:
+        raise ValueError('Voltages must be a one-dimensional array')
+    if not np.all(np.abs(voltages) <= _SOURCE_VOLTAGE_LIMIT):
+        raise ValueError(
+            f'Voltages must be finite and within '
+            f'±{_SOURCE_VOLTAGE_LIMIT} V'
+        )
+    return voltages
+
+
+def _setpoint_commands(voltages: NDArray[float]) -> list[str]:
+    """
+    Source level commands for every point of a sweep, formatted once before
+    the sweep instead of at each point.
+    """
+    return [f':SOUR:VOLT:LEV {v:.8f}' for v in voltages]
+
 
 class ProbeStation:
     """
@@ -31,17 +78,40 @@ class ProbeStation:
             '4wire' if self._voltmeter is not None else '2wire'
         )
 
-        self._delay = 0.01
-
         # default settings
         self.nplc(1)
         self._source.terminals('rear')
         self._source.write(':SENSe:RESistance:MODE MAN') # probably can be deleted
         self._source.mode('VOLT')
+        self.set_fast_mode(self.mode == '4wire')
         self._source.rangev(210e-3)
         self._source.volt(0.03)
         self._source.output(True)
 
+    @classmethod
+    def from_addresses(
+        cls,
+        source_address: str,
+        voltmeter_address: Optional[str] = None,
+        resource_manager: Optional[pyvisa.ResourceManager] = None
+    ) -> 'ProbeStation':
+        """
+        Connect the instruments at the given VISA addresses through one
+        shared resource manager and build a probe station from them.
+        """
+        if resource_manager is None:
+            resource_manager = pyvisa.ResourceManager()
+        source = Keithley2400(
+            'source', source_address, resource_manager=resource_manager
+        )
+        voltmeter = None
+        if voltmeter_address is not None:
+            voltmeter = Keithley2182A(
+                'voltmeter', voltmeter_address,
+                resource_manager=resource_manager
+            )
+        return cls(source, voltmeter)
+
     def set_mode(self, mode: Literal['2wire', '4wire']) -> None:
         """
         Switch between 2-wire and 4-wire measurement modes.
@@ -53,35 +123,198 @@ class ProbeStation:
         if mode == '4wire' and not self._voltmeter:
             raise RuntimeError("Cannot enable 4-wire mode without a voltmeter instrument")
         self.mode = mode
+        self.set_fast_mode(mode == '4wire')
+
+    def set_fast_mode(self, enabled: bool) -> None:
+        """
+        Toggle concurrent measurements on the source-meter. When fast mode
+        is enabled only current is sensed, which shortens every reading.
+
+        With concurrent measurements off the source-meter reports the
+        programmed voltage instead of a measured one, so fast mode is
+        enabled by default only in 4-wire mode, where the voltmeter
+        measures the voltage. Auto-zero and autoranging are handled per
+        sweep by `fast_sweep` and `_fixed_ranges`.
+        """
+        if enabled:
+            self._source.write(':SENS:FUNC:CONC OFF;:SENS:FUNC "CURR:DC"')
+        else:
+            self._source.write(':SENS:FUNC:CONC ON;:SENS:FUNC "VOLT:DC","CURR:DC"')
+
+    def _enter_fast_sweep(self) -> tuple:
+        """
+        Turn off the front panel displays, the source-meter auto-zero and
+        its averaging filter, and set the voltmeter trigger delay to
+        `_SETTLE_DELAY`. Returns the previous state for `_exit_fast_sweep`.
+        """
+        instruments = self._instruments()
+        displays = [inst.ask(':DISP:ENAB?') for inst in instruments]
+        autozero = self._source.ask(':SYST:AZER:STAT?')
+        average = self._source.ask(':SENS:AVER:STAT?')
+        trigger_delay = trigger_delay_auto = None
+        if self._voltmeter:
+            trigger_delay = self._voltmeter.ask(':TRIG:DEL?')
+            trigger_delay_auto = self._voltmeter.ask(':TRIG:DEL:AUTO?')
+        for inst in instruments:
+            inst.write(':DISP:ENAB OFF')
+        self._source.write(':SYST:AZER:STAT OFF;:SENS:AVER:STAT OFF')
+        if self._voltmeter:
+            self._voltmeter.write(f':TRIG:DEL {_SETTLE_DELAY}')
+        return displays, autozero, average, trigger_delay, trigger_delay_auto
+
+    def _exit_fast_sweep(self, state: tuple) -> None:
+        """
+        Restore the state saved by `_enter_fast_sweep`.
+        """
+        displays, autozero, average, trigger_delay, trigger_delay_auto = state
+        self._source.write(
+            f':SYST:AZER:STAT {autozero};:SENS:AVER:STAT {average}'
+        )
+        if self._voltmeter:
+            self._voltmeter.write(
+                f':TRIG:DEL {trigger_delay};:TRIG:DEL:AUTO {trigger_delay_auto}'
+            )
+        for inst, display in zip(self._instruments(), displays):
+            inst.write(f':DISP:ENAB {display}')
+
+    def _instruments(self) -> list:
+        """
+        Instruments taking part in a sweep.
+        """
+        instruments = [self._source]
+        if self._voltmeter:
+            instruments.append(self._voltmeter)
+        return instruments
+
+    @contextmanager
+    def fast_sweep(self) -> Iterator[None]:
+        """
+        Context manager for the duration of a sweep: turns off the front
+        panel displays, the source-meter auto-zero and its averaging filter,
+        sets the voltmeter trigger delay that lets each point settle, and
+        restores the previous state on exit.
+        """
+        state = self._enter_fast_sweep()
+        try:
+            yield
+        finally:
+            self._exit_fast_sweep(state)
+
+    @asynccontextmanager
+    async def _fast_sweep_async(self) -> AsyncIterator[None]:
+        """
+        Asynchronous variant of `fast_sweep` running its instrument I/O in
+        a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(None, self._enter_fast_sweep)
+        try:
+            yield
+        finally:
+            await loop.run_in_executor(None, self._exit_fast_sweep, state)
+
+    def _enter_fixed_ranges(self, voltages: NDArray[float]) -> tuple | None:
+        """
+        Disable autoranging and lock the source and voltmeter ranges to fit
+        the sweep and the present source level. Returns the previous range settings for
+        `_exit_fixed_ranges`.
+        """
+        if not len(voltages):
+            return None
+        v_max = float(np.max(np.abs(voltages)))
+        source_range = self._source.ask(':SOUR:VOLT:RANG?')
+        source_auto = self._source.ask(':SOUR:VOLT:RANG:AUTO?')
+        # the output stays at the present level until the first point
+        level = float(self._source.ask(':SOUR:VOLT:LEV?'))
+        self._source.write(
+            f':SOUR:VOLT:RANG:AUTO OFF;'
+            f':SOUR:VOLT:RANG {max(v_max, abs(level)):f}'
+        )
+        voltmeter_range = voltmeter_auto = None
+        if self._voltmeter:
+            # the 4-wire voltage drop never exceeds the applied voltage
+            voltmeter_range = self._voltmeter.range()
+            voltmeter_auto = self._voltmeter.autorange()
+            self._voltmeter.autorange(False)
+            self._voltmeter.range(min(v_max, _VOLTMETER_MAX_RANGE))
+        return source_range, source_auto, voltmeter_range, voltmeter_auto
+
+    def _exit_fixed_ranges(self, state: tuple | None) -> None:
+        """
+        Restore the range settings saved by `_enter_fixed_ranges`. The
+        previous source range is only restored if it still fits the present
+        level, otherwise the sweep range is kept.
+        """
+        if state is None:
+            return
+        source_range, source_auto, voltmeter_range, voltmeter_auto = state
+        level = float(self._source.ask(':SOUR:VOLT:LEV?'))
+        if abs(level) <= float(source_range):
+            self._source.write(f':SOUR:VOLT:RANG {source_range}')
+        self._source.write(f':SOUR:VOLT:RANG:AUTO {source_auto}')
+        if self._voltmeter:
+            self._voltmeter.range(voltmeter_range)
+            self._voltmeter.autorange(voltmeter_auto)
+
+    @contextmanager
+    def _fixed_ranges(self, voltages: NDArray[float]) -> Iterator[None]:
+        """
+        Context manager that disables autoranging and locks the source and
+        voltmeter ranges to fit the sweep, so no point pays for a range
+        change. The previous range settings are restored on exit.
+        """
+        state = self._enter_fixed_ranges(voltages)
+        try:
+            yield
+        finally:
+            self._exit_fixed_ranges(state)
 
-    def _measure_cv_4_wire(self) -> tuple[float, float, float]:
+    @asynccontextmanager
+    async def _fixed_ranges_async(
+            self,
+            voltages: NDArray[float]
+    ) -> AsyncIterator[None]:
         """
-        Perform a single 4-wire measurement: trigger both instruments,
-        read voltage from voltmeter, current from source-meter,
-        and source-meter's own voltage measurement.
+        Asynchronous variant of `_fixed_ranges` running its instrument I/O
+        in a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(
+            None, self._enter_fixed_ranges, voltages
+        )
+        try:
+            yield
+        finally:
+            await loop.run_in_executor(None, self._exit_fixed_ranges, state)
+
+    def _measure_cv_4_wire(self, set_cmd: str) -> tuple[float, float, float]:
+        """
+        Perform a single 4-wire measurement at the setpoint written by
+        `set_cmd`: set the voltage and trigger the source-meter, then trigger
+        and read the voltmeter, so both instruments integrate at the same
+        time. The voltmeter trigger delay lets the output settle first.
+        Finally read current and voltage from the source-meter.
         Returns (voltage_voltmeter, current, voltage_source).
         """
-        # initiate measurements
-        self._source.write('INIT')
-        time.sleep(self._delay)
-        self._voltmeter.write('INIT')
+        self._source.write(set_cmd + ';:INIT')
         # voltmeter reading
-        voltage_voltmeter = float(self._voltmeter.ask('FETC?'))
-        # source-meter returns '<voltage>,<current>'
-        resp = self._source.ask('FETC?').split(',')
+        voltage_voltmeter = float(self._voltmeter.ask_values(':INIT;:FETC?', 1)[0])
+        # source-meter returns (voltage, current)
+        resp = self._source.ask_values(':FETC?', 2)
         voltage_source = float(resp[0])
         current = float(resp[1])
         return voltage_voltmeter, current, voltage_source
 
 
-    def _measure_cv_2_wire(self) -> tuple[float, float]:
+    def _measure_cv_2_wire(self, set_cmd: str) -> tuple[float, float]:
         """
-        Perform a single 2-wire measurement: trigger source-meter,
-        read both voltage and current from its response.
+        Perform a single 2-wire measurement at the setpoint written by
+        `set_cmd`: set the voltage, trigger the source-meter and fetch both
+        voltage and current with a single compound query. `*WAI` keeps the
+        fetch behind the measurement on the instrument side.
         Returns (voltage, current).
         """
-        self._source.write('INIT')
-        resp = self._source.ask('FETC?').split(',')
+        resp = self._source.ask_values(set_cmd + ';:INIT;*WAI;:FETC?', 2)
         voltage = float(resp[0])
         current = float(resp[1])
         return voltage, current
@@ -94,37 +327,263 @@ class ProbeStation:
         Sweep a list of setpoint voltages, measure each point in the
         selected mode, and return arrays of measured voltages and currents.
 
-        For 4-wire mode, also returns the source-meter's voltage readings.
+        For 4-wire mode, also returns the source-meter's voltages. Fast mode
+        (the 4-wire default) turns off the source-meter's voltage
+        measurement, so these are then the programmed setpoints rather than
+        measured values.
+
+        Points are not pipelined: the source-meter keeps only its latest
+        reading and discards a pending reply when a new command arrives
+        (query interrupted), so the next setpoint cannot be sent before
+        the current point is fetched. Use `measure_cvc_buffered` to avoid
+        per-point round trips altogether.
 
         Returns:
           - 2-wire: (meas_v, meas_i, None)
           - 4-wire: (meas_v_voltmeter, meas_i, meas_v_source)
         """
-        meas_v: list[float] = []
-        meas_i: list[float] = []
-        meas_v_source: list[float] = []  # only used in 4-wire
-        for v_set in voltages:
-            self._source.volt(v_set)
+        voltages = _validate_voltages(voltages)
+        n = len(voltages)
+        meas_v = np.empty(n)
+        meas_i = np.empty(n)
+        # only used in 4-wire
+        meas_v_source = np.empty(n) if self.mode == '4wire' else None
+        last = None
+        try:
+            with self.fast_sweep(), self._fixed_ranges(voltages):
+                for k, set_cmd in enumerate(_setpoint_commands(voltages)):
+                    last = voltages[k]
+                    if self.mode == '4wire':
+                        meas_v[k], meas_i[k], meas_v_source[k] = (
+                            self._measure_cv_4_wire(set_cmd)
+                        )
+                    else:
+                        meas_v[k], meas_i[k] = self._measure_cv_2_wire(set_cmd)
+        finally:
+            # setpoints are written directly, keep the parameter cache in
+            # sync even when the sweep stops early
+            if last is not None:
+                self._source.volt.cache.set(float(last))
+        return meas_v, meas_i, meas_v_source
+
+    def _trigger_4_wire(self, set_cmd: str) -> None:
+        """
+        Set the voltage and trigger the source-meter, then trigger the
+        voltmeter, without waiting for either reading.
+        """
+        self._source.write(set_cmd + ';:INIT')
+        self._voltmeter.write(':INIT')
+
+    async def _measure_cv_4_wire_async(
+            self,
+            set_cmd: str
+    ) -> tuple[float, float, float]:
+        """
+        Asynchronous variant of `_measure_cv_4_wire`: both instruments are
+        triggered in a worker thread before anything is awaited, then both
+        fetches run concurrently in worker threads, so neither link idles
+        while the other is read.
+        Returns (voltage_voltmeter, current, voltage_source).
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._trigger_4_wire, set_cmd)
+        volt_resp, source_resp = await asyncio.gather(
+            loop.run_in_executor(None, self._voltmeter.ask_values, ':FETC?', 1),
+            loop.run_in_executor(None, self._source.ask_values, ':FETC?', 2),
+        )
+        return float(volt_resp[0]), float(source_resp[1]), float(source_resp[0])
+
+    async def iter_cvc_async(
+            self,
+            voltages: NDArray[float]
+    ) -> AsyncIterator[tuple[float, float, float | None]]:
+        """
+        Sweep the setpoint voltages and yield every point as soon as it is
+        measured, as (voltage, current, voltage_source) with voltage_source
+        None in 2-wire mode. Instrument I/O of each point runs in worker
+        threads, so other coroutines (e.g. polling a temperature controller)
+        keep running during the sweep.
+
+        If the sweep is cancelled or the caller stops iterating, the point
+        in flight is allowed to finish before the instrument settings are
+        restored, so the restore never interleaves with a measurement.
+        """
+        voltages = _validate_voltages(voltages)
+        loop = asyncio.get_running_loop()
+        async with self._fast_sweep_async(), self._fixed_ranges_async(voltages):
+            point = last = None
+            try:
+                for v_set, set_cmd in zip(voltages, _setpoint_commands(voltages)):
+                    last = v_set
+                    if self.mode == '4wire':
+                        point = asyncio.ensure_future(
+                            self._measure_cv_4_wire_async(set_cmd)
+                        )
+                        yield await asyncio.shield(point)
+                    else:
+                        point = loop.run_in_executor(
+                            None, self._measure_cv_2_wire, set_cmd
+                        )
+                        v, i = await asyncio.shield(point)
+                        yield v, i, None
+            finally:
+                if point is not None and not point.done():
+                    await asyncio.wait([point])
+                if last is not None:
+                    self._source.volt.cache.set(float(last))
+
+    async def measure_cvc_async(
+            self,
+            voltages: NDArray[float]
+    ) -> tuple[NDArray[float], NDArray[float], NDArray[float] | None]:
+        """
+        Asynchronous variant of `measure_cvc` that does not block the event
+        loop. Points are still measured one after another; in 4-wire mode
+        the two instruments of each point are serviced concurrently.
+
+        Returns the same tuples as `measure_cvc`.
+        """
+        n = len(voltages)
+        meas_v = np.empty(n)
+        meas_i = np.empty(n)
+        # only used in 4-wire
+        meas_v_source = np.empty(n) if self.mode == '4wire' else None
+        k = 0
+        async for v, i, v_src in self.iter_cvc_async(voltages):
+            meas_v[k] = v
+            meas_i[k] = i
+            if meas_v_source is not None:
+                meas_v_source[k] = v_src
+            k += 1
+        return meas_v, meas_i, meas_v_source
+
+    def _upload_voltage_list(self, voltages: NDArray[float]) -> None:
+        """
+        Load the setpoints into the source-meter's source list, appending
+        in chunks the instrument accepts per command.
+        """
+        for k in range(0, len(voltages), _SOURCE_LIST_CHUNK):
+            points = ','.join(
+                f'{v:.8f}' for v in voltages[k:k + _SOURCE_LIST_CHUNK]
+            )
+            cmd = ':SOUR:LIST:VOLT' if k == 0 else ':SOUR:LIST:VOLT:APP'
+            self._source.write(f'{cmd} {points}')
+
+    def _sweep_timeout(self, n: int) -> float | None:
+        """
+        VISA timeout (s) long enough to wait for an n-point sweep running
+        on the instrument, with generous margin over the integration time.
+        """
+        timeout = self._source.timeout()
+        if timeout is None:
+            return None
+        nplc = self._source.nplcv.get_latest() or 1
+        return timeout + n * (3 * nplc / _LINE_FREQUENCY + 0.01)
+
+    def measure_cvc_buffered(
+            self,
+            voltages: NDArray[float]
+    ) -> tuple[NDArray[float], NDArray[float], NDArray[float] | None]:
+        """
+        Run the whole sweep from the source-meter's internal source list
+        and read all points back with a single binary `:TRAC:DATA?`
+        transfer instead of querying every point.
+
+        In 4-wire mode the voltmeter is armed on external trigger and
+        fills its own buffer. The instruments must be connected by a
+        Trigger Link cable: the source-meter triggers the voltmeter once a
+        point has settled and waits for its voltmeter complete pulse before
+        sourcing the next point, so no voltmeter trigger is missed.
+
+        The uploaded source list is remembered, so repeating a sweep with
+        the same voltages skips the upload. The remembered list is dropped
+        when the source-meter is reset, and its point count is checked
+        against the instrument before it is reused.
+
+        Returns the same tuples as `measure_cvc`.
+        """
+        voltages = _validate_voltages(voltages)
+        n = len(voltages)
+        max_points = (
+            _VOLTMETER_BUFFER_SIZE if self.mode == '4wire'
+            else _SOURCE_BUFFER_SIZE
+        )
+        if not 0 < n <= max_points:
+            raise ValueError(
+                f'Buffered sweep supports 1 to {max_points} points, got {n}'
+            )
+
+        with self.fast_sweep(), self._fixed_ranges(voltages):
+            key = hashlib.blake2b(voltages.tobytes()).digest()
+            if (key != self._source.source_list_key
+                    or int(self._source.ask(':SOUR:LIST:VOLT:POIN?')) != n):
+                # the list may also have been changed behind our back
+                self._source.source_list_key = None
+                self._upload_voltage_list(voltages)
+                self._source.source_list_key = key
+            self._source.write(':SOUR:VOLT:MODE LIST')
+            self._source.write(f':TRIG:COUN {n}')
+            self._source.write(
+                f':TRAC:CLE;:TRAC:POIN {n};:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT'
+            )
             if self.mode == '4wire':
-                v_voltm, i, v_src = self._measure_cv_4_wire()
-                meas_v.append(v_voltm)
-                meas_i.append(i)
-                meas_v_source.append(v_src)
-            else:
-                v, i = self._measure_cv_2_wire()
-                meas_v.append(v)
-                meas_i.append(i)
-        v_arr = np.array(meas_v)
-        i_arr = np.array(meas_i)
+                # pulse the trigger line once the source has settled and
+                # wait for the voltmeter before every point but the first
+                self._source.write(
+                    f':TRIG:SOUR TLIN;:TRIG:DIR SOUR;:TRIG:INP SOUR;'
+                    f':TRIG:ILIN {_TRIGGER_LINE_IN};'
+                    f':TRIG:OLIN {_TRIGGER_LINE_OUT};:TRIG:OUTP DEL'
+                )
+                self._voltmeter.write(
+                    f':TRAC:CLE;:TRAC:POIN {n};:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT'
+                )
+                # the trigger pulse already follows the source delay
+                self._voltmeter.write(
+                    f':TRIG:SOUR EXT;:TRIG:DEL 0;:TRIG:COUN {n}'
+                )
+                self._voltmeter.write(':INIT')
+            try:
+                self._source.write(':INIT')
+                with self._source.timeout.set_to(self._sweep_timeout(n)):
+                    self._source.ask('*OPC?')
+                # buffer holds (voltage, current) per point
+                data = self._source.ask_values(':TRAC:DATA?', 2 * n).reshape(n, 2)
+                meas_v_source = data[:, 0]
+                meas_i = data[:, 1]
+                if self.mode == '4wire':
+                    with self._voltmeter.timeout.set_to(self._sweep_timeout(n)):
+                        self._voltmeter.ask('*OPC?')
+                    meas_v = self._voltmeter.ask_values(':TRAC:DATA?', n)
+            finally:
+                self._source.write(
+                    ':SOUR:VOLT:MODE FIX;:TRIG:COUN 1;:TRAC:FEED:CONT NEV'
+                )
+                if self.mode == '4wire':
+                    # line and detector choices only apply to TLIN
+                    self._source.write(
+                        ':TRIG:SOUR IMM;:TRIG:DIR ACC;:TRIG:OUTP NONE'
+                    )
+                    self._voltmeter.write(
+                        ':TRIG:SOUR IMM;:TRIG:COUN 1;:TRAC:FEED:CONT NEV'
+                    )
+
         if self.mode == '4wire':
-            return v_arr, i_arr, np.array(meas_v_source)
+            return meas_v, meas_i, meas_v_source
         else:
-            return v_arr, i_arr, None
+            return meas_v_source, meas_i, None
 
     def nplc(self, value: int) -> None:
         """
         Set integration time (NPLC) on both instruments if available.
+        The two instruments are written concurrently.
         """
-        self._source.nplcv(value)
-        if self._voltmeter:
-            self._voltmeter.nplc(value)
+        if not self._voltmeter:
+            self._source.nplcv(value)
+            return
+        with ThreadPoolExecutor(2) as executor:
+            futures = [
+                executor.submit(self._source.nplcv, value),
+                executor.submit(self._voltmeter.nplc, value),
+            ]
+            for future in futures:
+                future.result()
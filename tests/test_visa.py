@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from instrument_drivers.visa import VisaTransferMixin
+
+
+class _Handle:
+    """
+    Message-based resource returning one reply, read like pyvisa's
+    `read_bytes`: exactly the requested count, termination included.
+    """
+    read_termination = '\n'
+
+    def __init__(self, reply: bytes) -> None:
+        self.reply = reply
+        self.written = []
+
+    def write(self, cmd: str) -> None:
+        self.written.append(cmd)
+
+    def read_bytes(self, count: int) -> bytes:
+        if count > len(self.reply):
+            raise TimeoutError('read past the end of the reply')
+        block, self.reply = self.reply[:count], self.reply[count:]
+        return block
+
+
+def _instrument(datatype: str, reply: bytes) -> VisaTransferMixin:
+    instrument = VisaTransferMixin.__new__(VisaTransferMixin)
+    instrument._binary_data = True
+    instrument._binary_datatype = datatype
+    instrument.visa_handle = _Handle(reply)
+    return instrument
+
+
+def test_single_precision_block_with_termination_byte():
+    # 0x0A in the payload must not end the read
+    values = np.frombuffer(b'\x0a\x00\x80\x3f\x00\x00\x20\x40', dtype='<f4')
+    instrument = _instrument('f', b'#0' + values.tobytes() + b'\n')
+
+    readings = instrument.ask_values(':FETC?', 2)
+
+    assert instrument.visa_handle.written == [':FETC?']
+    assert instrument.visa_handle.reply == b''
+    assert readings.dtype == np.float64
+    np.testing.assert_array_equal(readings, values.astype(np.float64))
+
+
+def test_double_precision_block():
+    values = np.array([1.234567891e-6, -0.5], dtype='<f8')
+    instrument = _instrument('d', b'#0' + values.tobytes() + b'\n')
+
+    readings = instrument.ask_values(':TRAC:DATA?', 2)
+
+    assert instrument.visa_handle.reply == b''
+    np.testing.assert_array_equal(readings, values)
+
+
+def test_unexpected_header():
+    instrument = _instrument('f', b'#14' + bytes(4) + b'\n')
+
+    with pytest.raises(ValueError):
+        instrument.ask_values(':FETC?', 1)